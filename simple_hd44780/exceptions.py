@@ -1,8 +1,8 @@
-class BaseException(Exception):
+class HD44780Error(Exception):
     """Base exception class for which all our exceptions will innherit from."""
 
 
-class InvalidDisplayConfError(BaseException):
+class InvalidDisplayConfError(HD44780Error):
     """Raised if an invalid display configuration was attempted to be set.
 
     The only invalid configuration is if you try to set the display to 2 lines
@@ -16,3 +16,15 @@ class InvalidDisplayConfError(BaseException):
         )
 
         super().__init__(msg)
+
+
+class InvalidIndexError(HD44780Error):
+    """Raised if an index outside of the display's character slots was given.
+
+    Valid indices go from 0 up to (and including) the LCD's `max_index`.
+    """
+
+    def __init__(self, index, max_index):
+        msg = f"Invalid index: {index} is not between 0 and the display's max index ({max_index})."
+
+        super().__init__(msg)
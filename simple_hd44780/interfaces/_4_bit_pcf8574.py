@@ -1,5 +1,10 @@
 from simple_hd44780.interfaces.base import BaseInterface
 
+try:
+    from smbus2 import I2cFunc, SMBus, i2c_msg
+except ImportError:
+    I2cFunc = SMBus = i2c_msg = None
+
 
 class PCF8574I2CBackpackInterface(BaseInterface):
     """Interface for the I2C backpack with the PCF8574 8-bit I/O expander to drive the
@@ -11,8 +16,19 @@ class PCF8574I2CBackpackInterface(BaseInterface):
     data).  If your backpack is wired differently, you may have to change around the
     pins to their corresponding bits, but as an added bonus, this should work with ANY
     PCF8574 I2C backpack.
+
+    Inside a transaction (see `BaseInterface.transaction()`), the bytes meant for the
+    PCF8574 are appended to a buffer and only sent, in a single I2C transaction, once
+    the transaction ends.  Delays short enough to be covered by the I2C clocking of the
+    bytes that follow are dropped; longer ones flush the buffer before waiting.
     """
 
+    # The longest after-command delay (in microseconds) that can be left to the I2C clocking inside a transaction:
+    # two bytes sit between one command's last E pulse and the next one's first (~180us at 100kHz, ~45us at 400kHz).
+    _MAX_BUFFERED_DELAY_US = 60
+    # SMBus block writes carry a command byte plus at most 32 data bytes; the PCF8574 latches all of them.
+    _SMBUS_BLOCK_SIZE = 33
+
     def __init__(
         self,
         i2c_addr=0x27,
@@ -23,6 +39,7 @@ class PCF8574I2CBackpackInterface(BaseInterface):
         data_bits=[4, 5, 6, 7],
         i2c_peripherals=1,
         pre_configured_byte=0,
+        poll_busy_flag=False,
     ):
         """Creates a new PCF8574I2CBackpackInterface object.
 
@@ -37,11 +54,19 @@ class PCF8574I2CBackpackInterface(BaseInterface):
             :i2c_peripherals: Integer - A specifier for which set of I2C peripherals you're using.
             If you have more I2C interfaces, they'd be enumerated, I think (need more clarification?).
             :pre_configured_byte: Byte - Initial state of the control desired.
+            :poll_busy_flag: Boolean - True to read the HD44780's busy flag instead of waiting out the
+            worst-case time of slow commands (EG: clearing the display).  Only enable this if the backpack
+            actually wires the PCF8574's RW bit to the LCD's RW pin; if RW is tied LOW instead, the read
+            attempt is latched by the LCD as a write that moves its DDRAM address.
         """
-        import smbus
+        if SMBus is None:
+            raise ImportError("The PCF8574I2CBackpackInterface requires the `smbus2` package to be installed.")
 
-        self.bus = smbus.SMBus(i2c_peripherals)
+        self.bus = SMBus(i2c_peripherals)
         self.i2c_addr = i2c_addr
+        self.poll_busy_flag = poll_busy_flag
+        # Some I2C adapters only support SMBus transfers; those fall back to (32 byte) block writes.
+        self._supports_rdwr = bool(self.bus.funcs & I2cFunc.I2C)
 
         self.rs_bit_pos = rs_bit
         self.rw_bit_pos = rw_bit
@@ -49,29 +74,70 @@ class PCF8574I2CBackpackInterface(BaseInterface):
         self.a_bit_pos = a_bit
         self.data_bit_pos = data_bits
 
+        # Per-pin masks (and their inverses) so that we never have to shift at call time.
+        self._rs_mask = 1 << rs_bit
+        self._rs_nmask = ~self._rs_mask & 0xFF
+        self._rw_mask = 1 << rw_bit
+        self._rw_nmask = ~self._rw_mask & 0xFF
+        self._e_mask = 1 << e_bit
+        self._e_nmask = ~self._e_mask & 0xFF
+        self._a_mask = 1 << a_bit
+        self._a_nmask = ~self._a_mask & 0xFF
+
+        # Maps a nibble (D7-D4, high->low) to the PCF8574 bits it occupies.
+        self._data_shuffle = tuple(self._compose_nibble(nibble) for nibble in range(16))
+        self._data_mask = self._data_shuffle[0x0F]
+        # Maps a whole data byte to its (high nibble, low nibble) PCF8574 data bits.
+        self._byte_tbl = tuple((self._data_shuffle[byte >> 4], self._data_shuffle[byte & 0x0F]) for byte in range(256))
+
+        self._pending = None
+        self._transaction_depth = 0
+
         self._byte = pre_configured_byte
         self._write()
 
-    def writes_byte(func):
-        """Decorator helper to write the byte after the function ends.
+    def begin_transaction(self):
+        """Starts buffering the bytes meant for the PCF8574.
 
-        Note: This wrapper writes the current byte to the PCF8574, NOT to the LCD.  In
-        order to get the LCD to read the set-bits, we have to pulse the E pin (see
-        the `interfaces.BaseInterface` class for more information).
+        See `interfaces.BaseInterface` for more details.
+        """
+
+        if not self._transaction_depth:
+            self._pending = bytearray()
+        self._transaction_depth += 1
 
-        Used for:
-            set_rs_bit()
-            set_rw_bit()
-            pulse_enable_signal()
+    def end_transaction(self):
+        """Sends the buffered bytes in a single I2C transaction once the outer-most transaction ends.
+
+        See `interfaces.BaseInterface` for more details.
         """
 
-        def wrapped(self, *args, **kwargs):
-            func(self, *args, **kwargs)
-            self._write()
+        self._transaction_depth -= 1
+        if not self._transaction_depth:
+            # Even if the bus write fails, the transaction is over; later writes must go straight to the bus.
+            try:
+                self._flush()
+            finally:
+                self._pending = None
+
+    def delay(self, microseconds):
+        """Blocks for (at least) the given amount of microseconds.
 
-        return wrapped
+        Inside a transaction, short delays are dropped (the I2C clocking of the buffered bytes
+        already covers them) and longer ones flush the buffer first, so that the wait happens
+        after the preceding commands have actually been sent.
+
+        Arguments:
+            :microseconds: Integer - How long to block for.
+        """
+
+        if self._pending is not None:
+            if microseconds <= self._MAX_BUFFERED_DELAY_US:
+                return
+            self._flush()
+
+        super().delay(microseconds)
 
-    @writes_byte
     def set_rs_state(self, state):
         """Sets the RS bit to a given state.
 
@@ -82,9 +148,9 @@ class PCF8574I2CBackpackInterface(BaseInterface):
             the bit to 0.
         """
 
-        self._set_bit(self.rs_bit_pos, state & 1)
+        self._byte = (self._byte & self._rs_nmask) | (self._rs_mask if state else 0)
+        self._write()
 
-    @writes_byte
     def set_rw_state(self, state):
         """Sets the RW bit to a given state.
 
@@ -95,9 +161,9 @@ class PCF8574I2CBackpackInterface(BaseInterface):
             the bit to 0.
         """
 
-        self._set_bit(self.rw_bit_pos, state & 1)
+        self._byte = (self._byte & self._rw_nmask) | (self._rw_mask if state else 0)
+        self._write()
 
-    @writes_byte
     def set_backlight_state(self, state):
         """Sets the backlight bit to a given state.
 
@@ -108,98 +174,202 @@ class PCF8574I2CBackpackInterface(BaseInterface):
             the bit to 0.
         """
 
-        self._set_bit(self.a_bit_pos, state & 1)
+        self._byte = (self._byte & self._a_nmask) | (self._a_mask if state else 0)
+        self._write()
 
-    @writes_byte
     def _pulse_enable_signal(self):
         """Pulses the E bit in the following pattern LOW->HIGH->LOW.
 
-        The third `_write` is handled by the writes_byte decorator.  See
-        `interfaces.BaseInterface` for more details about the pin.
+        The E bit is never left HIGH, so the byte most recently written to the PCF8574
+        (EG: by `_set_data()`) is already the first LOW; only the HIGH and the final LOW
+        are written, in a single I2C transaction.  See `interfaces.BaseInterface` for
+        more details about the pin.
+        """
+
+        self._write_sequence(bytes([self._byte | self._e_mask, self._byte]))
+
+    def poll_busy(self):
+        """Reads the HD44780's busy flag.
 
+        Anything buffered by a transaction is sent first, since the flag is about the commands
+        already given to the LCD.  The data pins are written HIGH so that the PCF8574's quasi-
+        bidirectional pins can be pulled LOW by the LCD, then RW is set HIGH and RS LOW.  In
+        4-bit operation mode the status is read as two nibbles, so E is pulsed twice; only the
+        first (high) nibble holds the busy flag (D7).  See `interfaces.BaseInterface` for more
+        details.
 
+        This is opt-in (see the `poll_busy_flag` argument of `__init__()`), since it's only safe if
+        the RW pin is actually wired.
+
+        Returns:
+            Boolean - True while the HD44780 is still executing the last command, or NotImplemented
+            if busy flag polling isn't enabled.
         """
-        self._set_bit(self.e_bit_pos, 0)
-        self._write()
-        self.delay(1)
-        self._set_bit(self.e_bit_pos, 1)
-        self._write()
-        self.delay(1)
-        self._set_bit(self.e_bit_pos, 0)
+
+        if not self.poll_busy_flag:
+            return NotImplemented
+
+        self._flush()
+
+        read_byte = (self._byte | self._data_mask | self._rw_mask) & self._rs_nmask
+        self._send_sequence(bytes([read_byte, read_byte | self._e_mask]))
+        status = self.bus.read_byte(self.i2c_addr)
+        self._send_sequence(bytes([read_byte, read_byte | self._e_mask, read_byte, self._byte]))
+
+        return bool(status & self._data_shuffle[0x08])
 
     def send_data(self, byte, delay=60):
-        """Sets the 4 data bits to the ones given in the nibble.
+        """Sends a singular byte to the LCD as two nibbles.
 
-        We use the mask to take the higher-4 bits of the nibble, as well
-        as the lower-4 bits of our current byte (the RS/RW/E/A bits).  We
-        simply shift the data bits to where we want them and perform a
-        bitwise OR to combine them together, and then set it back into
-        our current byte for writing to the bus.  We then pulse so the LCD
-        will read our set-data bits.
+        See `send_bytes()` for how the nibbles are put on the bus.
 
         Argument:
             :byte: Byte/Integer - This is the data we want to send.
-            :is_nibble: Boolean - True to only send one nibble.  False
-            to send a "packet" (two nibbles, AKA a singular byte).
             :delay: Integer - After-command delay amount in micro-seconds.
         """
 
-        conf_bits = 0x0F & self._byte
-        data_bits = 0xF0 & byte
-        # Send the higher 4 bits first.
-        self._byte = data_bits | conf_bits
-        self._write()
-        self._pulse_enable_signal()
+        self.send_bytes((byte,), delay=delay)
 
-        # Send the lower 4 bits in another byte.
-        data_bits = (0x0F & byte) << 4
+    def send_bytes(self, data, delay=60):
+        """Sends several bytes to the LCD in a single I2C transaction, keeping the current RS state.
 
-        self._byte = data_bits | conf_bits
-        self._write()
-        self._pulse_enable_signal()
+        See `send_ops()` for how the bytes are put on the bus.
+
+        Argument:
+            :data: Iterable[Integer] - The bytes we want to send, in order.
+            :delay: Integer - Delay in micro-seconds after the last byte.
+        """
+
+        rs = 1 if self._byte & self._rs_mask else 0
+        self.send_ops([(rs, byte) for byte in data], delay=delay)
+
+    def send_ops(self, ops, delay=60):
+        """Sends several (RS state, byte) operations to the LCD in a single I2C transaction.
+
+        For every byte, we look up the data bits for both of its nibbles
+        (already scattered onto the configured data bit positions) and
+        perform a bitwise OR to combine them with the non-data bits of our
+        current byte (the RW/A bits) and the operation's RS bit.  Rather than
+        writing each state (and each E-pulse edge) individually, the whole
+        sequence (data, E HIGH, E LOW for each nibble) is built up-front and
+        sent to the PCF8574 at once.  The I2C clock alone keeps the E pulse
+        far wider than the ~450ns the HD44780 requires, and the two bytes
+        between one byte's last E pulse and the next byte's first one (~180us
+        at 100kHz) cover the ~37us the HD44780 needs to execute most commands.
+
+        The RS state of the last operation is kept afterwards.
+
+        Argument:
+            :ops: Iterable[Tuple[Integer, Integer]] - (RS state (0/1), byte) pairs to send, in order.
+            :delay: Integer - Delay in micro-seconds after the last byte.
+        """
+
+        conf_bits = self._byte & ~self._data_mask & self._e_nmask & self._rs_nmask
+        rs_conf_bits = (conf_bits, conf_bits | self._rs_mask)
+        e_mask = self._e_mask
+        # Bind everything used inside the loop to locals; it runs once per character.
+        byte_tbl = self._byte_tbl
+        buf = bytearray()
+        extend = buf.extend
+        for rs, byte in ops:
+            # Higher 4 bits go first, then the lower 4 bits.
+            hi, lo = byte_tbl[byte]
+            hi |= rs_conf_bits[rs]
+            lo |= rs_conf_bits[rs]
+            extend((hi, hi | e_mask, hi, lo, lo | e_mask, lo))
+
+        if not buf:
+            return
+
+        self._write_sequence(buf)
+        self._byte = buf[-1]
 
         self.delay(delay)
 
-    @writes_byte
     def _set_data(self, byte):
         """Only sets the data bits from the byte.
 
-        Uses a mask to take the upper-bits and uses them as the data bits.  Since
-        the PCF8574 is an 8 bit expander and the 4 bits are already in use, we
-        can only write a nibble.
+        Uses the upper-bits as the data bits.  Since the PCF8574 is an 8 bit
+        expander and the 4 bits are already in use, we can only write a nibble.
 
         Arguments:
             :byte: Byte - The byte containing the upper-bits you want to use.
         """
 
-        for i in range(4):
-            pos = 7 - i
-            self._set_bit(pos, (byte >> pos) & 1)
+        self._byte = (self._byte & ~self._data_mask) | self._data_shuffle[(byte >> 4) & 0x0F]
+        self._write()
 
-    def _set_bit(self, pos, val):
-        """Sets a bit at a specific position to a specific value.
+    def _compose_nibble(self, nibble):
+        """Scatters the bits of a nibble onto the configured data bit positions.
 
-        The position is 0-based and assumes that a byte is in Most-Significant-Bit
-        -First order.  Visual representation below:
-            bits:  00000000
-            index: 76543210
+        Bit 0 of the nibble is D4, so it goes to `data_bit_pos[0]`, bit 1 (D5) to
+        `data_bit_pos[1]`, and so on.
 
         Arguments:
-            :pos: Integer - The 0-based index of the bit you want to set.
-            :val: Boolean - The value you want to set.
+            :nibble: Integer - The 4 bits (0-15) to scatter.
         """
 
-        if val:
-            self._byte |= 1 << pos
-        else:
-            self._byte &= ~(1 << pos)
+        byte = 0
+        for i, pos in enumerate(self.data_bit_pos):
+            byte |= ((nibble >> i) & 1) << pos
+
+        return byte
 
     def _write(self):
         """Writes the current bit-state to the PCF8574.
 
         Note: This function writes to the PCF8574 only, it does NOT write
-        to the LCD (that is achieved through pulsing the e_bit).
+        to the LCD (that is achieved through pulsing the e_bit).  There is no
+        delay afterwards; a single byte on a 100kHz I2C bus already takes ~90us,
+        which covers the HD44780's setup/hold times.
         """
 
-        self.bus.write_byte(self.i2c_addr, self._byte)
-        self.delay(1)
+        if self._pending is not None:
+            self._pending.append(self._byte)
+        else:
+            self.bus.write_byte(self.i2c_addr, self._byte)
+
+    def _write_sequence(self, seq):
+        """Writes a sequence of bit-states to the PCF8574 in one I2C transaction.
+
+        Each byte in the sequence is latched by the PCF8574 in order, exactly as if
+        they were written one-by-one with `_write()`, but it only costs one trip
+        through the kernel.
+
+        Arguments:
+            :seq: Bytes - The bit-states to write, in order.
+        """
+
+        if self._pending is not None:
+            self._pending += seq
+        else:
+            self._send_sequence(seq)
+
+    def _flush(self):
+        """Sends the bytes buffered by the current transaction (if any) and empties the buffer."""
+
+        if self._pending:
+            self._send_sequence(bytes(self._pending))
+            self._pending.clear()
+
+    def _send_sequence(self, seq):
+        """Puts a sequence of bit-states on the bus with as few transfers as the I2C adapter allows.
+
+        Adapters supporting plain I2C transfers get the whole sequence in a single `i2c_rdwr`.
+        SMBus-only adapters get it split into block writes; the PCF8574 has no registers, so the
+        "command" byte of each block is simply latched like the rest of the data.
+
+        Arguments:
+            :seq: Bytes - The bit-states to write, in order.
+        """
+
+        if self._supports_rdwr:
+            self.bus.i2c_rdwr(i2c_msg.write(self.i2c_addr, seq))
+            return
+
+        for i in range(0, len(seq), self._SMBUS_BLOCK_SIZE):
+            block = seq[i : i + self._SMBUS_BLOCK_SIZE]
+            if len(block) == 1:
+                self.bus.write_byte(self.i2c_addr, block[0])
+            else:
+                self.bus.write_i2c_block_data(self.i2c_addr, block[0], list(block[1:]))
@@ -1,6 +1,20 @@
+import contextlib
+import itertools
 import time
 from abc import ABCMeta
 
+# Delays (in microseconds) shorter than this are busy-waited rather than slept.
+_BUSY_WAIT_THRESHOLD_US = 100
+
+# Maps the (operational_mode, lines, matrix_size, increment_direction, display_shift) initialization flags to the
+# commands sent after the static initialization: Function Set, display off, clear and Entry Mode Set.
+_INIT_SEQUENCES = {
+    (op, lines, matrix, inc, shift): bytes(
+        (0x20 | (op << 4) | (lines << 3) | (matrix << 2), 0x08, 0x01, 0x04 | (inc << 1) | shift)
+    )
+    for op, lines, matrix, inc, shift in itertools.product((0, 1), repeat=5)
+}
+
 
 class BaseInterface(metaclass=ABCMeta):
     """ABC defining required methods for an LCD interface.
@@ -8,7 +22,7 @@ class BaseInterface(metaclass=ABCMeta):
     An interface is defined as the "thing between the microcontroller and
     the LCD controller", regardless whether that "thing" is some kind of
     BUS or raw I/O pins.  Note: there is NO type checking/validation at this
-    level (OTHER than normalizing to 1/0 with the bitwise AND).
+    level (OTHER than normalizing states to 1/0 by their truthiness).
 
     The relevant necessary pins to be controlled on the HD44780 are listed below:
         - RS
@@ -68,8 +82,9 @@ class BaseInterface(metaclass=ABCMeta):
                 - Set Enable pin HIGH
                 - Set Enable pin LOW
 
-    IMPORTANT: To limit the necessary libraries associated with this, make sure that you perform
-    any platform-specific dependency imports (EG: Rpi.GPIO) INSIDE the interface's `__init__()` method.
+    IMPORTANT: To limit the necessary libraries associated with this, make sure that any platform-specific
+    dependency imports (EG: Rpi.GPIO) are guarded with a `try/except ImportError` at the top of the interface's
+    module, and that the interface's `__init__()` method raises if the dependency is missing.
 
     An interface must implement the following thing in order to be used by the LCD class:
         `_pulse_enable_signal()`
@@ -79,11 +94,58 @@ class BaseInterface(metaclass=ABCMeta):
         `set_backlight_state(state)`
         `send_data(byte, delay=??)`
         `initialize(operation_mode, operation_mode, lines, matrix_size, memory_direction, display_shift)`
+
+    And may override the following things if it can do better than the defaults:
+        `poll_busy()`
+        `send_bytes(data, delay=??)`
+        `send_ops(ops, delay=??)`
+        `begin_transaction()`
+        `end_transaction()`
     """
 
     def delay(self, microseconds):
-        """This is going to be useful during the initialization method."""
-        time.sleep(microseconds / 1000000)
+        """Blocks for (at least) the given amount of microseconds.
+
+        `time.sleep()` hands control back to the scheduler and usually comes back ~50-100us
+        late, which is longer than most of the HD44780's command delays, so short delays are
+        busy-waited instead.
+
+        Arguments:
+            :microseconds: Integer - How long to block for.
+        """
+        if microseconds < _BUSY_WAIT_THRESHOLD_US:
+            end = time.perf_counter_ns() + microseconds * 1000
+            while time.perf_counter_ns() < end:
+                pass
+        else:
+            time.sleep(microseconds / 1000000)
+
+    def begin_transaction(self):
+        """Starts buffering writes instead of sending them to the LCD straight away.
+
+        By default interfaces write straight through, so this does nothing; interfaces that can
+        send several writes at once (EG: over a bus) should override this along with
+        `end_transaction()`.  Transactions may be nested, only the outer-most one sends anything.
+        """
+
+    def end_transaction(self):
+        """Sends everything buffered since the matching `begin_transaction()` call."""
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Context manager wrapping `begin_transaction()`/`end_transaction()`.
+
+        Usage:
+            with interface.transaction():
+                interface.set_rs_state(1)
+                interface.send_bytes(b"Hello")
+                interface.set_rs_state(0)
+        """
+        self.begin_transaction()
+        try:
+            yield self
+        finally:
+            self.end_transaction()
 
     def set_rs_state(self, state):
         """This must set the state of the RS pin to HIGH/LOW.
@@ -124,6 +186,52 @@ class BaseInterface(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def poll_busy(self):
+        """This reads the HD44780's busy flag (RS LOW, RW HIGH, flag on D7).
+
+        Interfaces that can't read from the LCD (EG: the RW pin is tied to ground) should leave this as is;
+        callers then fall back to waiting out the command's worst-case execution time.
+
+        Returns:
+            Boolean - True while the HD44780 is still executing the last command, or NotImplemented.
+        """
+        return NotImplemented
+
+    def send_bytes(self, data, delay=60):
+        """This sends several data bytes to the LCD, one after the other.
+
+        By default this simply calls `send_data()` for each byte; interfaces that can
+        put several bytes on the wire at once should override it.
+
+        Arguments:
+            :data: Iterable[Byte/Integer] - The bytes to send, in order.
+            :delay: Integer - after-command delay in microseconds (applied after each byte).
+        """
+        send = self.send_data
+        for byte in data:
+            send(byte, delay=delay)
+
+    def send_ops(self, ops, delay=60):
+        """This sends several data bytes to the LCD, each with its own RS state.
+
+        By default this sets the RS pin whenever it changes and calls `send_data()` for each byte, all inside
+        a single transaction; interfaces that can do better should override it.  The RS state of the last
+        operation is kept afterwards.
+
+        Arguments:
+            :ops: Iterable[Tuple[Integer, Byte/Integer]] - (RS state (0/1), byte) pairs to send, in order.
+            :delay: Integer - after-command delay in microseconds (applied after each byte).
+        """
+        set_rs = self.set_rs_state
+        send = self.send_data
+        curr_rs = None
+        with self.transaction():
+            for rs, byte in ops:
+                if rs != curr_rs:
+                    set_rs(rs)
+                    curr_rs = rs
+                send(byte, delay=delay)
+
     def _pulse_enable_signal(self):
         """Pulses the enable-signal pin with the pattern of LOW->HIGH->LOW."""
         raise NotImplementedError
@@ -139,18 +247,27 @@ class BaseInterface(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
-    def _static_initialization(self):
-        """This should handle the static initialization sequence specified by the data sheet."""
+    def _static_initialization(self, already_initialized=False):
+        """This should handle the static initialization sequence specified by the data sheet.
+
+        The 0x30 command is always sent three times: whatever state (8-bit mode, or 4-bit mode halfway
+        through a byte) the controller is in, three of them put it back into 8-bit mode.  The long waits
+        before the first two are only needed right after power-up; if the controller is known to already
+        be powered (EG: a warm restart of your program), ~100us between them is enough.
+
+        Arguments:
+            :already_initialized: Boolean - True to skip the power-up waits.
+        """
 
         self.set_rs_state(0)
         self.set_rw_state(0)
 
-        self.delay(15000)
+        self.delay(100 if already_initialized else 15000)
         # Static command of 00110000.
         self._set_data(0x30)
         self._pulse_enable_signal()
 
-        self.delay(4100)
+        self.delay(100 if already_initialized else 4100)
         # Static command of 00110000.
         self._set_data(0x30)
         self._pulse_enable_signal()
@@ -161,7 +278,9 @@ class BaseInterface(metaclass=ABCMeta):
         self._pulse_enable_signal()
         self.delay(100)
 
-    def initialize(self, operational_mode, lines, matrix_size, increment_direction, display_shift):
+    def initialize(
+        self, operational_mode, lines, matrix_size, increment_direction, display_shift, already_initialized=False
+    ):
         """This is the initialization sequence specified in the data sheet.
 
         After performing the static initialization sequence, the next byte you send determines the
@@ -218,25 +337,29 @@ class BaseInterface(metaclass=ABCMeta):
             increment as we move to the left.
             :display_shift: - Boolean/Integer - True/1 to enable display-shifting.  False/0 to disable
             display-shifting.
+            :already_initialized: - Boolean - True to skip the long power-up waits of the static initialization
+            sequence (only safe if the controller has already been powered up before).
         """
-        self._static_initialization()
+        self._static_initialization(already_initialized=already_initialized)
 
-        function_set_command = 0x20
-        entry_mode_set_command = 0x04
+        flags = (operational_mode, lines, matrix_size, increment_direction, display_shift)
+        function_set_command, display_off_command, clear_command, entry_mode_set_command = _INIT_SEQUENCES[
+            tuple(1 if flag else 0 for flag in flags)
+        ]
         if operational_mode:
             # For 8 bit operation.
-            self._set_data(function_set_command | (operational_mode << 4) | (lines << 3) | (matrix_size << 2))
+            self._set_data(function_set_command)
             self._pulse_enable_signal()
         else:
             # For 4 bit operation.
-            self._set_data(function_set_command)
+            self._set_data(0x20)
             self._pulse_enable_signal()
             self.delay(1000)
 
-            self.send_data(function_set_command | (lines << 3) | (matrix_size << 2))
+            self.send_data(function_set_command)
 
         # Static byte.
-        self.send_data(0x08)
+        self.send_data(display_off_command)
         # Clear screen/return DDRAM address to 0 (home).
-        self.send_data(0x01, delay=3000)
-        self.send_data(entry_mode_set_command | (increment_direction << 1) | display_shift)
+        self.send_data(clear_command, delay=3000)
+        self.send_data(entry_mode_set_command)
@@ -1,3 +1,36 @@
+import time
+
+from simple_hd44780.exceptions import InvalidIndexError
+
+
+def _encode_chars(payload, start_index, line_width, ddram_cmds, cursor_set=False):
+    """Builds the (RS state, byte) operations that write `payload` to the DDRAM starting at `start_index`.
+
+    The HD44780 doesn't move the DDRAM address from the end of one line to the start of the next (see
+    `LCD._convert_index_to_mem_addr()`), so a DDRAM Set command is inserted before every character that lands on
+    the start of a line, including the first one when a previous write left the cursor there.  This is kept as a
+    plain function over ints/tuples/lists so the whole loop stays in one frame.
+
+    Arguments:
+        :payload: Bytes - The encoded characters to write.
+        :start_index: Integer - The 0-based index the cursor is currently at.
+        :line_width: Integer - How many character slots each line shows.
+        :ddram_cmds: Tuple[Integer] - The DDRAM Set command for every index on the display.
+        :cursor_set: Boolean - True if the DDRAM address was just set to `start_index`, so no DDRAM Set is needed
+        for the first character.
+    """
+    ops = []
+    index = start_index
+    max_len = len(ddram_cmds)
+    for byte in payload:
+        if 0 < index < max_len and not index % line_width and not (cursor_set and index == start_index):
+            ops.append((0, ddram_cmds[index]))
+        ops.append((1, byte))
+        index += 1
+
+    return ops
+
+
 class LCD:
     """HD44780 LCD class.
 
@@ -79,6 +112,28 @@ class LCD:
                 Bits:  1AAAAAAA
     """
 
+    __slots__ = (
+        "interface",
+        "_send",
+        "_set_rs",
+        "_set_bl",
+        "_lines",
+        "_row_offsets",
+        "_line_width",
+        "max_index",
+        "_max_len",
+        "_ddram_cmds",
+        "_curr_index",
+        "_backlight_enabled",
+        "_display_enabled",
+        "_cursor_enabled",
+        "_cursor_blinking_enabled",
+        "_toggle_byte",
+        "_last_toggle_byte",
+        "_text",
+        "_text_synced",
+    )
+
     def __init__(
         self,
         interface,
@@ -93,6 +148,7 @@ class LCD:
         operational_mode=0,
         increment_direction=True,
         display_shifting=False,
+        already_initialized=False,
     ):
         """Creates a new LCD controller.
 
@@ -123,7 +179,7 @@ class LCD:
         Arguments:
             :interface: BaseInterface child class - the "hardware" interface to use.
             :lines: Integer - How many lines you want your LCD to use.
-            False for 1 line.  Will think about adding 4-line support shortly.
+            1 (or False) for a 16x1 display, 2 for a 16x2 display and 4 for a 20x4 display.
             :matrix_size: Boolean/Integer - True/1 for 5x10 matrix-size per char.  Fa-
             lse/0 for 5x7 matrix-size per char.
             :default_text: String - Default text to be written to the display.
@@ -143,34 +199,64 @@ class LCD:
             :increment_direction: Boolean - Direction the DDRAM address increments.  True for right,
             False for left.
             :display_shift: Boolean - Enables/disables display-shifting.  True for on, False for off.
+            :already_initialized: Boolean - Whether or not the HD44780 has already been powered up and initialized
+            (EG: restarting your program without power-cycling the display).  True to skip the ~19ms of power-up
+            waits during the initialization routine, False to perform the full routine.
         """
 
         self.interface = interface
+        # Bound once here, these are used on every write.
+        self._send = interface.send_data
+        self._set_rs = interface.set_rs_state
+        self._set_bl = interface.set_backlight_state
         if not skip_setup:
             self.interface.initialize(
                 operational_mode=operational_mode,
-                lines=lines,
+                lines=lines > 1,
                 matrix_size=matrix_size,
                 increment_direction=increment_direction,
                 display_shift=display_shifting,
+                already_initialized=already_initialized,
             )
 
         self._lines = lines
-        self.max_index = self._get_max_index()
+        # DDRAM address of the first character slot of each line, and how many slots each line shows.
+        self._row_offsets = (0x00, 0x40, 0x14, 0x54)
+        self._line_width = 20 if lines == 4 else 16
+        # 16x1 (`False`/0 also meaning 1 line, as the Function Set does), 16x2 and 20x4 displays respectively.
+        self.max_index = {0: 15, 1: 15, 2: 31, 4: 79}.get(lines, 31)
         self._max_len = self.max_index + 1
+        # DDRAM Set command for every index on the display, so moving the cursor needs no arithmetic.
+        self._ddram_cmds = tuple(
+            self._build_set_ddram_command(self._convert_index_to_mem_addr(index)) for index in range(self._max_len)
+        )
         self._curr_index = 0
 
-        # It doesn't matter what the values are, as they'll be overwritten shortly.
         self._backlight_enabled = False
-        self._display_enabled = False
-        self._cursor_enabled = False
-        self._cursor_blinking_enabled = False
-        self._text = self._get_init_text(default_text="")
-
-        self.backlight_enabled = backlight_enabled
-        self.display_enabled = display_enabled
-        self.cursor_enabled = cursor_enabled
-        self.cursor_blinking_enabled = cursor_blinking_enabled
+        self._display_enabled = display_enabled
+        self._cursor_enabled = cursor_enabled
+        self._cursor_blinking_enabled = cursor_blinking_enabled
+        # The display-toggle controls command (see `_build_toggle_command()`), kept up to date by the setters.
+        self._toggle_byte = (
+            0x08
+            | (0x04 if display_enabled else 0)
+            | (0x02 if cursor_enabled else 0)
+            | (0x01 if cursor_blinking_enabled else 0)
+        )
+        self._last_toggle_byte = None
+        # Mirror of what's on the display, one byte per character slot.  Being preallocated and mutable, single
+        # characters can be updated in place.  It only matches the display once it has been cleared, either by
+        # the initialization routine or by `clear()`; when attaching to an already-running display, whatever is
+        # on it is unknown.
+        self._text = bytearray(b" " * self._max_len)
+        self._text_synced = not skip_setup
+
+        with self.interface.transaction():
+            self.backlight_enabled = backlight_enabled
+            # All three display toggles live in the same command, so only send it once.
+            self._write_display_control()
+            if default_text:
+                self.text = default_text
 
     def write_text(self, text, start_index=None):
         """Writes the given text to the LCD.
@@ -181,38 +267,84 @@ class LCD:
             writing at.  Note: index 16 is the first-character slot of the 2nd line.
         """
 
-        if start_index is not None:
-            self.set_cursor(start_index)
+        # Only the ASCII range of the HD44780's CGROM is portable (the codes above 0x7F hold Japanese or European
+        # glyphs depending on the ROM, neither of which is latin-1), so anything outside it is shown as "?" rather
+        # than as the wrong glyph.  Encoding does the whole string in one go rather than calling `ord()` per
+        # character.  Other character codes can still be written by passing them to `write_char()`.
+        payload = text.encode("ascii", "replace")
+
+        self._write_payload(payload, start_index)
+
+    def _write_payload(self, payload, start_index=None):
+        """Writes already-encoded characters to the LCD (and to the `text` mirror).
+
+        Arguments:
+            :payload: Bytes - The encoded characters to write.
+            :start_index: Integer/None - Optional specifier to the index to start writing at.
+        """
+
+        interface = self.interface
+        with interface.transaction():
+            if start_index is not None:
+                self.set_cursor(start_index)
+
+            interface.send_ops(
+                _encode_chars(
+                    payload, self._curr_index, self._line_width, self._ddram_cmds, cursor_set=start_index is not None
+                )
+            )
+            self._set_rs(0)
 
-        for char in text:
-            self.write_char(char)
+        start = self._curr_index
+        end = min(start + len(payload), self._max_len)
+        if start < end:
+            self._text[start:end] = payload[: end - start]
+        self._curr_index += len(payload)
 
     def write_char(self, char, index=None):
         """writes a singular character to the LCD.
 
         Arguments:
-            :char: String - The singular character to write to the LCD.
-            :start_index: Integer/None - Optional specifier to the index to start
+            :char: String/Integer - The singular character to write to the LCD, or its already-encoded
+            character code (EG: an item of a `bytes` object).
+            :index: Integer/None - Optional specifier to the index to start
             writing at.  Note: index 16 is the first-character slot of the 2nd line.
         """
-        if index is not None:
-            self.set_cursor(index)
+        byte = char if isinstance(char, int) else char.encode("ascii", "replace")[0]
 
-        self.interface.set_rs_state(1)
-        self.interface.send_data(ord(char))
-        self.interface.set_rs_state(0)
-        self._curr_index += 1
+        self._write_payload(bytes((byte,)), index)
 
     def clear(self):
         """Clears the DDRAM entirely and sets the DDRAM address to 0 (first character slot).
 
         This also clears the `text` attribute.  The data byte is always going to be 0x01 for this command.
-        There is an extensive delay for this command (~2ms).
+        There is an extensive delay for this command (~2ms), which is cut short if the interface can read
+        the busy flag.
         """
-        self._text = ""
+        self._text[:] = b" " * self._max_len
+        self._text_synced = True
         self._curr_index = 0
 
-        self.interface.send_data(0x01, delay=3000)
+        self._send(0x01, delay=0)
+        self._wait_while_busy(3000)
+
+    def _wait_while_busy(self, timeout):
+        """Waits until the HD44780 is done executing the last command.
+
+        The busy flag is polled if the interface supports it.  Otherwise (or if the flag still hasn't cleared
+        by then, EG: the RW pin isn't actually wired), this waits for the whole timeout.
+
+        Arguments:
+            :timeout: Integer - Worst-case execution time of the last command in microseconds.
+        """
+        busy = self.interface.poll_busy()
+        if busy is NotImplemented:
+            self.interface.delay(timeout)
+            return
+
+        deadline = time.perf_counter_ns() + timeout * 1000
+        while busy and time.perf_counter_ns() < deadline:
+            busy = self.interface.poll_busy()
 
     def set_cursor(self, index):
         """Sets the cursor to the specified index.
@@ -221,42 +353,50 @@ class LCD:
         If you have cursor blinking disabled, it will appear as a solid underscore underneath the
         character.
 
-        If the index is 0, we can use command #2.
-            Command 2. Set DDRAM address to 0 (but doesn't clear the DDRAM):
-                RS: 0
-                RW: 0
-                Data bits:
-                    Index: 76543210
-                    Bits:  0000001X
-
-        If the index is something else other than that, we're going to have to calculate where it should go.
-        See `_convert_index_to_mem_addr(index)` for more info.
+        The cursor is always moved with command #6 (DDRAM Set), even for index 0: command #2 (return home)
+        would also work there, but it takes ~1.52ms to execute versus ~37us for a DDRAM Set.  See
+        `_convert_index_to_mem_addr(index)` for how the index maps to a DDRAM address (the commands for every
+        index are built once, during initialization).
 
         Argument:
             :index: Integer - The 0-based index where you want to set the cursor to.
+
+        Raises:
+            :InvalidIndexError: If the index is outside of the display's character slots.
         """
-        if index == 0:
-            self.interface.send_data(0x02)
-            self._curr_index = 0
+        if not 0 <= index < self._max_len:
+            raise InvalidIndexError(index, self.max_index)
 
-        addr = self._convert_index_to_mem_addr(index)
-        data = self._build_set_ddram_command(addr)
+        self._send(self._ddram_cmds[index])
         self._curr_index = index
 
-        self._curr_index = 0
-        self.interface.send_data(data)
-
     @property
     def text(self):
-        return self._text
+        return self._text.rstrip(b" ").decode("latin-1")
 
     @text.setter
     def text(self, new_text):
-        if len(new_text) + len(self.text) > self.max_index:
-            pass
-
-        self.clear()
-        self.write_text(new_text)
+        # Rather than clearing the display (~1.52ms) and re-writing everything, only the character slots that
+        # actually change are written: one DDRAM Set plus the characters for each run of changed slots.  Text
+        # longer than the display is cut off, shorter text is padded with spaces.  If the display's current
+        # contents are unknown (see `skip_setup`), it is cleared first so that there is something to diff against.
+        if not self._text_synced:
+            self.clear()
+
+        payload = new_text.encode("ascii", "replace")[: self._max_len].ljust(self._max_len, b" ")
+        curr_text = self._text
+
+        with self.interface.transaction():
+            index = 0
+            while index < self._max_len:
+                if payload[index] == curr_text[index]:
+                    index += 1
+                    continue
+
+                start = index
+                while index < self._max_len and payload[index] != curr_text[index]:
+                    index += 1
+                self._write_payload(payload[start:index], start)
 
     @property
     def lines(self):
@@ -269,7 +409,7 @@ class LCD:
     @backlight_enabled.setter
     def backlight_enabled(self, state):
         self._backlight_enabled = state
-        self.interface.set_backlight_state(state)
+        self._set_bl(state)
 
         return self._backlight_enabled
 
@@ -279,10 +419,12 @@ class LCD:
 
     @display_enabled.setter
     def display_enabled(self, state):
-        self._display_enabled = state
+        if state == self._display_enabled:
+            return self._display_enabled
 
-        data = self._build_toggle_command()
-        self.interface.send_data(data)
+        self._display_enabled = state
+        self._toggle_byte = (self._toggle_byte & ~0x04) | (0x04 if state else 0)
+        self._write_display_control()
 
         return self._display_enabled
 
@@ -292,10 +434,12 @@ class LCD:
 
     @cursor_enabled.setter
     def cursor_enabled(self, state):
-        self._cursor_enabled = state
+        if state == self._cursor_enabled:
+            return self._cursor_enabled
 
-        data = self._build_toggle_command()
-        self.interface.send_data(data)
+        self._cursor_enabled = state
+        self._toggle_byte = (self._toggle_byte & ~0x02) | (0x02 if state else 0)
+        self._write_display_control()
 
         return self._cursor_enabled
 
@@ -305,15 +449,33 @@ class LCD:
 
     @cursor_blinking_enabled.setter
     def cursor_blinking_enabled(self, state):
+        if state == self._cursor_blinking_enabled:
+            return self._cursor_blinking_enabled
+
         self._cursor_blinking_enabled = state
+        self._toggle_byte = (self._toggle_byte & ~0x01) | (0x01 if state else 0)
+        self._write_display_control()
+
+        return self._cursor_blinking_enabled
+
+    def _write_display_control(self):
+        """Sends the display-toggle controls command with the current display/cursor/blinking states.
+
+        Nothing is sent if the command is the same as the last one sent.
+        """
 
         data = self._build_toggle_command()
-        self.interface.send_data(data)
+        if data == self._last_toggle_byte:
+            return
 
-        return self._cursor_blinking_enabled
+        self._send(data)
+        self._last_toggle_byte = data
 
     def _build_toggle_command(self):
-        """Builds the display-toggle controls data byte.
+        """Returns the display-toggle controls data byte.
+
+        The byte itself is built once in `__init__()` and then only has its D/C/B bits flipped by the
+        corresponding setters.
 
         Command 3. Display toggle controls:
             This command toggles common display controls (display/cursor/blinking) listed below:
@@ -331,7 +493,7 @@ class LCD:
                 Bits:  00001DCB
         """
 
-        return 0x08 | self._display_enabled << 2 | self._cursor_enabled << 1 | (self._cursor_blinking_enabled & 1)
+        return self._toggle_byte
 
     def _build_set_ddram_command(self, addr):
         """Builds the set-address pointer data byte.
@@ -355,25 +517,6 @@ class LCD:
 
         return 0x80 | addr
 
-    def _get_max_index(self):
-        if self._lines >> 1:
-            # Then we know we have two lines.
-            return 31
-        else:
-            return 15
-
-    def _get_init_text(self, default_text):
-        """Builds a usable List to hold characters in.
-
-        I know that this:
-            1. Isn't great for memory, but it's < 1kb, honestly, I think if this is substantial, you should
-            probably use a lower level language anyway.
-            2. Is a bit messy, but it will make the user's life easier, since they won't have to muck about with
-            addresses, they can simply just use an index to specify where their cursor should be.
-        """
-        # TODO: Read all chars from DDRAM? Do I want to do that? Or just force-initialize?  Let's see how the
-        # performance is with reading all the chars first.
-
     def _convert_index_to_mem_addr(self, index):
         """Converts an index to a memory address.
 
@@ -391,14 +534,7 @@ class LCD:
             :index: Integer - 0-based index that you want to get the memory-address for.
         """
 
-        # This is a fun bit-twiddling trick.  `n // m` can be rewritten as `n >> p` where `m = 2^p`.
-        if index >> 4:
-            offset = 0x40
-        else:
-            offset = 0x00
-        # Another fun bit-twiddling trick. `n % m` can be rewritten as `(n & 2^p) - 1` where `m = 2^p`.
-        index &= 0x0F
-
-        # The address is simply the offset + index after moduloing 16 (Note: We can use the OR operator to perform
-        # addition here since we're gauranteed that our first and second nibbles will be completely separate).
-        return index | offset
+        # The lines of a 4-line display don't sit on nibble boundaries (0x14, 0x54), so this has to be an
+        # addition rather than an OR.
+        row, col = divmod(index, self._line_width)
+        return self._row_offsets[row] + col
@@ -4,7 +4,7 @@ from simple_hd44780.interfaces import PCF8574I2CBackpackInterface
 
 interface = PCF8574I2CBackpackInterface(0x27)
 
-lcd = LCD(interface, lines=1, matrix_size=0)
+lcd = LCD(interface, lines=2, matrix_size=0)
 
 # This is "one row" (16 chars).
 lcd.write_char("A", 0)
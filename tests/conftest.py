@@ -5,5 +5,5 @@ import pytest
 
 @pytest.fixture(autouse=True)
 def mock_smbus():
-    with mock.patch("smbus.SMBus") as smbus_mock:
+    with mock.patch("simple_hd44780.interfaces._4_bit_pcf8574.SMBus") as smbus_mock:
         yield smbus_mock
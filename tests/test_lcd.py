@@ -0,0 +1,215 @@
+"""Tests for the LCD controller."""
+
+from unittest import mock
+
+import pytest
+
+from simple_hd44780 import LCD
+from simple_hd44780.exceptions import InvalidIndexError
+from simple_hd44780.interfaces import BaseInterface
+
+
+@pytest.fixture
+def interface():
+    interface = mock.create_autospec(BaseInterface, instance=True)
+    interface.poll_busy.return_value = NotImplemented
+
+    return interface
+
+
+@pytest.fixture
+def lcd(interface):
+    lcd = LCD(interface)
+    interface.reset_mock()
+
+    return lcd
+
+
+def test_write_text_should_send_the_whole_string_at_once(lcd, interface):
+    lcd.write_text("abc")
+
+    interface.send_ops.assert_called_once_with([(1, 0x61), (1, 0x62), (1, 0x63)])
+    interface.set_rs_state.assert_called_once_with(0)
+
+
+def test_write_text_should_move_the_cursor_to_the_next_line(lcd, interface):
+    lcd.write_text("abc", start_index=14)
+
+    interface.send_data.assert_called_once_with(0x8E)
+    interface.send_ops.assert_called_once_with([(1, 0x61), (1, 0x62), (0, 0xC0), (1, 0x63)])
+    assert lcd._curr_index == 17
+
+
+def test_write_text_should_move_the_cursor_when_continuing_onto_the_next_line(lcd, interface):
+    lcd.write_text("0123456789abcdef")
+    interface.reset_mock()
+
+    lcd.write_text("g")
+    lcd.write_char("h")
+
+    assert interface.send_ops.call_args_list == [mock.call([(0, 0xC0), (1, 0x67)]), mock.call([(1, 0x68)])]
+    assert lcd.text == "0123456789abcdefgh"
+
+
+def test_write_text_should_not_repeat_an_explicit_cursor_move(lcd, interface):
+    lcd.write_text("g", start_index=16)
+
+    interface.send_data.assert_called_once_with(0xC0)
+    interface.send_ops.assert_called_once_with([(1, 0x67)])
+
+
+def test_init_should_send_the_display_toggles_in_one_command(interface):
+    LCD(interface, display_enabled=True, cursor_enabled=False, cursor_blinking_enabled=True, skip_setup=True)
+
+    interface.send_data.assert_called_once_with(0x0D)
+
+
+@pytest.mark.parametrize(("lines", "function_set_command"), ((1, 0x20), (2, 0x28)))
+def test_init_should_set_the_number_of_lines(lines, function_set_command):
+    interface = mock.create_autospec(BaseInterface, instance=True)
+    interface.initialize.side_effect = lambda **kwargs: BaseInterface.initialize(interface, **kwargs)
+
+    LCD(interface, lines=lines)
+
+    assert interface.send_data.call_args_list[:4] == [
+        mock.call(function_set_command),
+        mock.call(0x08),
+        mock.call(0x01, delay=3000),
+        mock.call(0x06),
+    ]
+
+
+@pytest.mark.parametrize(("lines", "max_index"), ((False, 15), (0, 15), (1, 15), (2, 31), (4, 79)))
+def test_init_should_size_the_display_by_the_number_of_lines(interface, lines, max_index):
+    lcd = LCD(interface, lines=lines, skip_setup=True)
+
+    assert lcd.max_index == max_index
+    assert len(lcd._ddram_cmds) == max_index + 1
+
+
+def test_display_toggle_setters_should_not_resend_unchanged_states(lcd, interface):
+    lcd.cursor_enabled = True
+    lcd.cursor_blinking_enabled = 1
+
+    interface.send_data.assert_not_called()
+
+    lcd.cursor_enabled = False
+
+    interface.send_data.assert_called_once_with(0x0D)
+
+
+@pytest.mark.parametrize(("index", "command"), ((0, 0x80), (5, 0x85), (16, 0xC0), (31, 0xCF)))
+def test_set_cursor_should_send_a_single_ddram_set_command(lcd, interface, index, command):
+    lcd.set_cursor(index)
+
+    interface.send_data.assert_called_once_with(command)
+    assert lcd._curr_index == index
+
+
+@pytest.mark.parametrize(("index", "command"), ((19, 0x93), (20, 0xC0), (31, 0xCB), (40, 0x94), (79, 0xE7)))
+def test_set_cursor_should_handle_4_line_displays(interface, index, command):
+    lcd = LCD(interface, lines=4)
+    interface.reset_mock()
+
+    lcd.set_cursor(index)
+
+    interface.send_data.assert_called_once_with(command)
+
+
+def test_lcd_should_not_have_an_instance_dict(lcd):
+    assert not hasattr(lcd, "__dict__")
+
+
+@pytest.mark.parametrize("char", ("€", "é"))
+def test_write_text_should_replace_non_ascii_characters(lcd, interface, char):
+    lcd.write_text(f"a{char}b")
+
+    interface.send_ops.assert_called_once_with([(1, 0x61), (1, 0x3F), (1, 0x62)])
+
+
+def test_text_setter_should_only_write_the_changed_characters(lcd, interface):
+    lcd.text = "hello world"
+    interface.reset_mock()
+
+    lcd.text = "help! worlds"
+
+    assert interface.send_data.call_args_list == [mock.call(0x83), mock.call(0x8B)]
+    assert interface.send_ops.call_args_list == [mock.call([(1, 0x70), (1, 0x21)]), mock.call([(1, 0x73)])]
+    assert lcd.text == "help! worlds"
+
+
+def test_text_setter_should_blank_the_leftover_characters(lcd, interface):
+    lcd.text = "abc"
+    interface.reset_mock()
+
+    lcd.text = "a"
+
+    interface.send_data.assert_called_once_with(0x81)
+    interface.send_ops.assert_called_once_with([(1, 0x20), (1, 0x20)])
+
+
+@pytest.mark.parametrize("char", ("A", 0x41, b"A"[0]))
+def test_write_char_should_accept_strings_and_character_codes(lcd, interface, char):
+    lcd.write_char(char)
+
+    interface.send_ops.assert_called_once_with([(1, 0x41)])
+    assert lcd.text[0] == "A"
+
+
+def test_clear_should_wait_for_the_busy_flag(lcd, interface):
+    interface.poll_busy.side_effect = [True, True, False]
+
+    lcd.clear()
+
+    interface.send_data.assert_called_once_with(0x01, delay=0)
+    assert interface.poll_busy.call_count == 3
+    interface.delay.assert_not_called()
+
+
+def test_clear_should_fall_back_to_a_fixed_delay(lcd, interface):
+    lcd.clear()
+
+    interface.send_data.assert_called_once_with(0x01, delay=0)
+    interface.delay.assert_called_once_with(3000)
+
+
+def test_display_toggle_setters_should_update_their_own_bit(lcd, interface):
+    lcd.display_enabled = False
+    lcd.cursor_blinking_enabled = False
+    lcd.cursor_enabled = False
+    lcd.display_enabled = True
+
+    assert interface.send_data.call_args_list == [mock.call(0x0B), mock.call(0x0A), mock.call(0x08), mock.call(0x0C)]
+
+
+def test_init_should_write_the_default_text(interface):
+    lcd = LCD(interface, default_text="hi", skip_setup=True)
+
+    interface.send_data.assert_any_call(0x80)
+    interface.send_ops.assert_called_once_with([(1, 0x68), (1, 0x69)])
+    assert lcd.text == "hi"
+
+
+@pytest.mark.parametrize("index", (-1, 32))
+def test_set_cursor_should_reject_indices_outside_the_display(lcd, interface, index):
+    with pytest.raises(InvalidIndexError):
+        lcd.set_cursor(index)
+
+    interface.send_data.assert_not_called()
+    assert lcd._curr_index == 0
+
+
+def test_text_setter_should_clear_a_display_it_did_not_set_up(interface):
+    lcd = LCD(interface, skip_setup=True)
+    interface.reset_mock()
+
+    lcd.text = "    "
+
+    interface.send_data.assert_called_once_with(0x01, delay=0)
+    interface.send_ops.assert_not_called()
+
+    interface.reset_mock()
+    lcd.text = "a"
+
+    interface.send_data.assert_called_once_with(0x80)
+    interface.send_ops.assert_called_once_with([(1, 0x61)])
@@ -0,0 +1,152 @@
+"""Tests for the PCF8574 I2C backpack interface."""
+
+import pytest
+
+from simple_hd44780.interfaces import PCF8574I2CBackpackInterface
+
+
+@pytest.fixture
+def interface():
+    return PCF8574I2CBackpackInterface(pre_configured_byte=0x08)
+
+
+def test_send_data_should_write_both_nibbles_in_one_transaction(interface):
+    interface.bus.i2c_rdwr.reset_mock()
+
+    interface.send_data(0x41)
+
+    interface.bus.i2c_rdwr.assert_called_once()
+    (msg,) = interface.bus.i2c_rdwr.call_args.args
+    assert bytes(msg) == bytes([0x48, 0x4C, 0x48, 0x18, 0x1C, 0x18])
+
+
+def test_pulse_enable_signal_should_write_all_edges_in_one_transaction(interface):
+    interface.bus.i2c_rdwr.reset_mock()
+
+    interface._pulse_enable_signal()
+
+    interface.bus.i2c_rdwr.assert_called_once()
+    (msg,) = interface.bus.i2c_rdwr.call_args.args
+    assert bytes(msg) == bytes([0x0C, 0x08])
+
+
+def test_set_data_should_honour_the_configured_data_bits():
+    interface = PCF8574I2CBackpackInterface(data_bits=[7, 6, 5, 4], pre_configured_byte=0x08)
+
+    interface._set_data(0x30)
+
+    assert interface._byte == 0xC8
+
+
+def test_send_bytes_should_write_every_byte_in_one_transaction(interface):
+    interface.bus.i2c_rdwr.reset_mock()
+
+    interface.send_bytes(b"AB")
+
+    interface.bus.i2c_rdwr.assert_called_once()
+    (msg,) = interface.bus.i2c_rdwr.call_args.args
+    assert bytes(msg) == bytes([0x48, 0x4C, 0x48, 0x18, 0x1C, 0x18, 0x48, 0x4C, 0x48, 0x28, 0x2C, 0x28])
+
+
+def test_send_data_should_honour_the_configured_data_bits():
+    interface = PCF8574I2CBackpackInterface(data_bits=[7, 6, 5, 4], pre_configured_byte=0x08)
+    interface.bus.i2c_rdwr.reset_mock()
+
+    interface.send_data(0x41)
+
+    (msg,) = interface.bus.i2c_rdwr.call_args.args
+    assert bytes(msg) == bytes([0x28, 0x2C, 0x28, 0x88, 0x8C, 0x88])
+
+
+def test_transaction_should_send_everything_in_one_i2c_transaction(interface):
+    interface.bus.reset_mock()
+
+    with interface.transaction():
+        interface.set_rs_state(1)
+        interface.send_data(0x41)
+        interface.set_rs_state(0)
+
+    interface.bus.write_byte.assert_not_called()
+    interface.bus.i2c_rdwr.assert_called_once()
+    (msg,) = interface.bus.i2c_rdwr.call_args.args
+    assert bytes(msg) == bytes([0x09, 0x49, 0x4D, 0x49, 0x19, 0x1D, 0x19, 0x18])
+
+
+def test_transaction_should_flush_before_long_delays(interface):
+    interface.bus.reset_mock()
+
+    with interface.transaction():
+        interface.send_data(0x01, delay=0)
+        interface.bus.i2c_rdwr.assert_not_called()
+        interface.send_data(0x01, delay=1)
+        interface.bus.i2c_rdwr.assert_not_called()
+        interface.send_data(0x01, delay=100)
+        interface.bus.i2c_rdwr.assert_called_once()
+
+    assert interface.bus.i2c_rdwr.call_count == 1
+
+
+def test_transaction_should_end_even_if_the_flush_fails(interface):
+    interface.bus.reset_mock()
+    interface.bus.i2c_rdwr.side_effect = OSError(121, "Remote I/O error")
+
+    with pytest.raises(OSError):
+        with interface.transaction():
+            interface.send_data(0x41)
+
+    interface.set_backlight_state(0)
+
+    assert interface._pending is None
+    interface.bus.write_byte.assert_called_once()
+
+
+def test_send_bytes_should_fall_back_to_block_writes_without_i2c_support(interface):
+    interface._supports_rdwr = False
+    interface.bus.reset_mock()
+
+    interface.send_bytes(b"ABCDEF")
+
+    interface.bus.i2c_rdwr.assert_not_called()
+    blocks = [bytes([cmd, *data]) for (_, cmd, data), _ in interface.bus.write_i2c_block_data.call_args_list]
+    assert [len(block) for block in blocks] == [33, 3]
+    assert blocks[0][:6] == bytes([0x48, 0x4C, 0x48, 0x18, 0x1C, 0x18])
+
+
+def test_send_ops_should_set_rs_per_byte(interface):
+    interface.bus.i2c_rdwr.reset_mock()
+
+    interface.send_ops([(0, 0xC0), (1, 0x41)])
+
+    (msg,) = interface.bus.i2c_rdwr.call_args.args
+    assert bytes(msg) == bytes([0xC8, 0xCC, 0xC8, 0x08, 0x0C, 0x08, 0x49, 0x4D, 0x49, 0x19, 0x1D, 0x19])
+    assert interface._byte == 0x19
+
+
+def test_poll_busy_should_not_touch_the_bus_unless_enabled(interface):
+    interface.bus.reset_mock()
+
+    assert interface.poll_busy() is NotImplemented
+    assert not interface.bus.mock_calls
+
+
+@pytest.mark.parametrize(("status", "busy"), ((0xF8, True), (0x78, False)))
+def test_poll_busy_should_read_d7(interface, status, busy):
+    interface.poll_busy_flag = True
+    interface.bus.read_byte.return_value = status
+
+    assert interface.poll_busy() is busy
+    assert interface._byte == 0x08
+
+
+def test_initialize_should_resync_with_three_static_commands_when_already_initialized(interface):
+    written = []
+    interface.bus.write_byte.side_effect = lambda addr, byte: written.append(byte)
+    interface.bus.i2c_rdwr.side_effect = lambda msg: written.extend(bytes(msg))
+
+    interface.initialize(
+        operational_mode=0, lines=1, matrix_size=0, increment_direction=1, display_shift=0, already_initialized=True
+    )
+
+    # The HD44780 latches the data pins on each falling edge of E.
+    nibbles = [byte >> 4 for byte, next_byte in zip(written, written[1:]) if byte & 0x04 and not next_byte & 0x04]
+    assert nibbles == [0x3, 0x3, 0x3, 0x2, 0x2, 0x8, 0x0, 0x8, 0x0, 0x1, 0x0, 0x6]